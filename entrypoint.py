@@ -1,74 +1,268 @@
 import os
 import sys
-import json
 import datetime
-from dateutil import rrule, parser
-import pytz
+import functools
+import zoneinfo
+from dataclasses import dataclass
+
+_UTC = datetime.timezone.utc
+_OUTPUTS = []
 
 def get_input(name, default=None):
     return os.environ.get(f"INPUT_{name.upper()}", default)
 
+@dataclass(slots=True)
+class Inputs:
+    environment: str | None
+    behavior: str
+    timezone: str
+    freeze_start: str | None
+    freeze_end: str | None
+    rrule: str | None
+    duration_minutes: str | None
+    override: str | None
+    fail_message: str
+    summary_enabled: bool
+    fast_allow: bool
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            environment=get_input("environment"),
+            behavior=get_input("behavior", "block").lower(),
+            timezone=get_input("timezone", "UTC"),
+            freeze_start=get_input("freeze_start"),
+            freeze_end=get_input("freeze_end"),
+            rrule=get_input("rrule"),
+            duration_minutes=get_input("duration_minutes"),
+            override=get_input("override"),
+            fail_message=get_input("fail_message", "Release freeze is active. Deployment prevented."),
+            summary_enabled=get_input("summary", "true").lower() == "true",
+            fast_allow=get_input("fast_allow", "false").lower() == "true",
+        )
+
 def set_output(name, value):
-    with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
-        f.write(f"{name}={value}\n")
+    _OUTPUTS.append(f"{name}={value}\n")
 
-def write_summary(environ, now_local, now_utc, is_frozen, decision, window_details, override_details):
-    if get_input("summary", "true").lower() != "true":
+def flush_outputs():
+    if not _OUTPUTS:
         return
+    with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
+        f.write("".join(_OUTPUTS))
+    _OUTPUTS.clear()
 
-    summary = f"""
-### Release Freeze Status: {decision} {get_status_emoji(decision)}
+_SUMMARY_TEMPLATE = """
+### Release Freeze Status: {decision} {emoji}
 
 | Metric | Value |
 | :--- | :--- |
 | **Environment** | `{environ}` |
 | **Local Time** | `{now_local}` |
 | **UTC Time** | `{now_utc}` |
-| **Status** | `{'Frozen' if is_frozen else 'Free'}` |
+| **Status** | `{status}` |
 
 """
+
+def emit_outputs(environment, now_local, now_utc, is_frozen=False, decision="ALLOW", window_type="NONE",
+                 window_name="", reason="", active_start=None, active_end=None, overridden=False,
+                 override_reason=""):
+    set_output("is_frozen", "true" if is_frozen else "false")
+    set_output("decision", decision)
+    set_output("environment", environment)
+    set_output("now_local", now_local.isoformat())
+    set_output("now_utc", now_utc.isoformat())
+    set_output("window_type", window_type)
+    set_output("window_name", window_name)
+    set_output("reason", reason)
+    set_output("freeze_start", active_start.isoformat() if active_start else "")
+    set_output("freeze_end", active_end.isoformat() if active_end else "")
+    set_output("overridden", "true" if overridden else "false")
+    set_output("override_reason", override_reason)
+
+def write_summary(environ, now_local_dt, now_utc_dt, is_frozen, decision, window_details, override_details):
+    parts = [_SUMMARY_TEMPLATE.format_map({
+        "decision": decision,
+        "emoji": get_status_emoji(decision),
+        "environ": environ,
+        "now_local": now_local_dt.strftime('%Y-%m-%d %H:%M:%S %Z'),
+        "now_utc": now_utc_dt.strftime('%Y-%m-%d %H:%M:%S UTC'),
+        "status": "Frozen" if is_frozen else "Free",
+    })]
     if window_details:
-        summary += f"#### Active Freeze Window\n{window_details}\n"
+        parts.append(f"#### Active Freeze Window\n{window_details}\n")
     
     if override_details:
-        summary += f"#### Override Active\n{override_details}\n"
+        parts.append(f"#### Override Active\n{override_details}\n")
 
     with open(os.environ['GITHUB_STEP_SUMMARY'], 'a') as f:
-        f.write(summary)
+        f.writelines(parts)
+
+_STATUS_EMOJI = {"BLOCK": "🚫", "WARN": "⚠️"}
 
 def get_status_emoji(decision):
-    if decision == "BLOCK": return "🚫"
-    if decision == "WARN": return "⚠️"
-    return "✅"
+    return _STATUS_EMOJI.get(decision, "✅")
 
+@functools.lru_cache(maxsize=32)
 def parse_timezone(tz_str):
     try:
-        return pytz.timezone(tz_str)
-    except pytz.UnknownTimeZoneError:
-        print(f"::error::Unknown timezone: {tz_str}")
-        sys.exit(1)
+        return zoneinfo.ZoneInfo(tz_str)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        pass
+    # pytz matched names case-insensitively (e.g. 'asia/dhaka'); keep accepting those
+    folded = tz_str.casefold()
+    for name in zoneinfo.available_timezones():
+        if name.casefold() == folded:
+            return zoneinfo.ZoneInfo(name)
+    print(f"::error::Unknown timezone: {tz_str}")
+    sys.exit(1)
 
-def main():
-    env_name = get_input("environment")
-    if not env_name:
+def _parse_iso(value):
+    """Parse an ISO-8601 timestamp, falling back to dateutil for anything else."""
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil import parser
+        return parser.parse(value)
+
+_RRULE_PERIODS = {
+    "WEEKLY": datetime.timedelta(weeks=1),
+    "DAILY": datetime.timedelta(days=1),
+    "HOURLY": datetime.timedelta(hours=1),
+    "MINUTELY": datetime.timedelta(minutes=1),
+    "SECONDLY": datetime.timedelta(seconds=1),
+}
+_RRULE_MONTHS = {"MONTHLY": 1, "YEARLY": 12}
+
+def _rrule_params(rule_line):
+    """Split an RRULE line such as 'FREQ=WEEKLY;BYDAY=SA' into a dict."""
+    if rule_line.upper().startswith("RRULE:"):
+        rule_line = rule_line[len("RRULE:"):]
+    params = {}
+    for part in rule_line.split(";"):
+        if "=" in part:
+            key, value = part.split("=", 1)
+            params[key.strip().upper()] = value.strip().upper()
+    return params
+
+def _shift_dtstart(start, anchor, params):
+    """Move start forward by whole periods so it lands at or just before anchor."""
+    freq = params.get("FREQ")
+    interval = int(params.get("INTERVAL", 1))
+    if "COUNT" in params or start >= anchor:
+        return start
+    if freq in _RRULE_PERIODS:
+        step = _RRULE_PERIODS[freq] * interval
+        return start + (anchor - start) // step * step
+    if freq in _RRULE_MONTHS and start.day <= 28:
+        step = _RRULE_MONTHS[freq] * interval
+        months = (anchor.year - start.year) * 12 + anchor.month - start.month
+        months -= months % step
+        while months > 0:
+            total = start.month - 1 + months
+            shifted = start.replace(year=start.year + total // 12, month=total % 12 + 1)
+            if shifted <= anchor:
+                return shifted
+            months -= step
+    return start
+
+def _anchor_rrule(rrule_str, now_naive, duration):
+    """Return (rule_text, dtstart) with DTSTART moved to just before any window active at now_naive."""
+    lines = [line.strip() for line in rrule_str.strip().splitlines() if line.strip()]
+    dtstart_lines = [line for line in lines if line.upper().startswith("DTSTART")]
+    rule_lines = [line for line in lines if not line.upper().startswith("DTSTART")]
+    rule_line = next((line for line in rule_lines if line.upper().startswith("RRULE:") or ":" not in line), "")
+    params = _rrule_params(rule_line)
+
+    anchor = now_naive - datetime.timedelta(minutes=duration)
+    if params.get("FREQ") in ("HOURLY", "MINUTELY", "SECONDLY"):
+        anchor = anchor.replace(minute=0, second=0, microsecond=0)
+    else:
+        anchor = anchor.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if not dtstart_lines:
+        return "\n".join(rule_lines), anchor
+
+    name, _, value = dtstart_lines[0].partition(":")
+    if ";" in name or value.upper().endswith("Z"):
+        # TZID/UTC-qualified DTSTART: leave it to dateutil untouched
+        return rrule_str, anchor
+    start = _shift_dtstart(_parse_iso(value), anchor, params)
+    return "\n".join(rule_lines), start
+
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_FAST_RRULE_KEYS = {"FREQ", "INTERVAL", "WKST", "BYDAY", "BYHOUR", "BYMINUTE", "BYSECOND"}
+
+@functools.lru_cache(maxsize=16)
+def _fast_rrule_params(rrule_str):
+    """Return (weekdays, start offsets in seconds, latest first) for a plain WEEKLY/DAILY rule, else None."""
+    rrule_str = rrule_str.strip()
+    if "\n" in rrule_str:
+        return None
+    params = _rrule_params(rrule_str)
+    if not set(params) <= _FAST_RRULE_KEYS or params.get("INTERVAL", "1") != "1":
+        return None
+    freq = params.get("FREQ")
+    if freq not in ("WEEKLY", "DAILY") or (freq == "WEEKLY" and "BYDAY" not in params):
+        return None
+    try:
+        days = frozenset(_WEEKDAYS[day] for day in params.get("BYDAY", ",".join(_WEEKDAYS)).split(","))
+        hours = [int(h) for h in params.get("BYHOUR", "0").split(",")]
+        minutes = [int(m) for m in params.get("BYMINUTE", "0").split(",")]
+        seconds = [int(s) for s in params.get("BYSECOND", "0").split(",")]
+    except (KeyError, ValueError):
+        return None
+    if not (all(0 <= h < 24 for h in hours) and all(0 <= m < 60 for m in minutes)
+            and all(0 <= s < 60 for s in seconds)):
+        return None
+    offsets = tuple(sorted({h * 3600 + m * 60 + s for h in hours for m in minutes for s in seconds}, reverse=True))
+    return days, offsets
+
+def _fast_rrule_match(fast_rule, duration, now_naive):
+    """Return the latest occurrence of fast_rule at or before now_naive, or None if too old to matter."""
+    days, offsets = fast_rule
+    midnight = now_naive.replace(hour=0, minute=0, second=0, microsecond=0)
+    for day_offset in range(duration // 1440 + 2):
+        day = midnight - datetime.timedelta(days=day_offset)
+        if day.weekday() not in days:
+            continue
+        for offset in offsets:
+            start = day + datetime.timedelta(seconds=offset)
+            if start <= now_naive:
+                return start
+    return None
+
+@functools.lru_cache(maxsize=16)
+def _compile_rrule(rule_text, dtstart):
+    from dateutil import rrule
+    return rrule.rrulestr(rule_text, dtstart=dtstart)
+
+def run():
+    inputs = Inputs.from_env()
+    if not inputs.environment:
         print("::error::Input 'environment' is required.")
         sys.exit(1)
-        
-    behavior = get_input("behavior", "block").lower()
-    tz_str = get_input("timezone", "UTC")
-    freeze_start_str = get_input("freeze_start")
-    freeze_end_str = get_input("freeze_end")
-    rrule_str = get_input("rrule")
-    duration_mins = get_input("duration_minutes")
-    secret_override = get_input("override")
-    fail_msg = get_input("fail_message", "Release freeze is active. Deployment prevented.")
-
-    timezone = parse_timezone(tz_str)
-    now_utc = datetime.datetime.now(pytz.utc)
-    now_local = now_utc.astimezone(timezone)
+    if (inputs.freeze_start or inputs.freeze_end) and inputs.rrule:
+        print("::error::Cannot specify both fixed window (freeze_start/end) and recurring window (rrule).")
+        sys.exit(1)
+    if inputs.rrule and not inputs.duration_minutes:
+        print("::error::Input 'duration_minutes' is required when using 'rrule'.")
+        sys.exit(1)
+
+    # UTC (the default) needs no conversion; the fixed-offset tzinfo also
+    # keeps replace()/comparisons off the zoneinfo transition table.
+    is_utc = inputs.timezone.upper() == "UTC"
+    timezone = _UTC if is_utc else parse_timezone(inputs.timezone)
+    now_local = datetime.datetime.now(timezone)
+    now_utc = now_local if is_utc else now_local.astimezone(_UTC)
     
-    print(f"Checking freeze for environment: {env_name}")
-    print(f"Current time: {now_local} ({tz_str}) / {now_utc} (UTC)")
+    print(f"Checking freeze for environment: {inputs.environment}")
+    print(f"Current time: {now_local} ({inputs.timezone}) / {now_utc} (UTC)")
+
+    if inputs.fast_allow and inputs.behavior == "allow" and not inputs.summary_enabled and not inputs.override:
+        # Nothing left that depends on the freeze state; skip evaluating it.
+        print("Behavior is 'allow' and fast_allow is set; skipping freeze evaluation.")
+        emit_outputs(inputs.environment, now_local, now_utc, reason="Freeze evaluation skipped (fast_allow)")
+        sys.exit(0)
 
     is_frozen = False
     window_type = "NONE"
@@ -77,19 +271,15 @@ def main():
     active_end = None
     reason = "No active freeze window"
 
-    if (freeze_start_str or freeze_end_str) and rrule_str:
-        print("::error::Cannot specify both fixed window (freeze_start/end) and recurring window (rrule).")
-        sys.exit(1)
-
-    if freeze_start_str and freeze_end_str:
+    if inputs.freeze_start and inputs.freeze_end:
         try:
-            dt_start = parser.parse(freeze_start_str)
-            dt_end = parser.parse(freeze_end_str)
+            dt_start = _parse_iso(inputs.freeze_start)
+            dt_end = _parse_iso(inputs.freeze_end)
             
             if dt_start.tzinfo is None:
-                dt_start = timezone.localize(dt_start)
+                dt_start = dt_start.replace(tzinfo=timezone)
             if dt_end.tzinfo is None:
-                dt_end = timezone.localize(dt_end)
+                dt_end = dt_end.replace(tzinfo=timezone)
 
             if dt_start <= now_local <= dt_end:
                 is_frozen = True
@@ -102,17 +292,16 @@ def main():
             print(f"::error::Failed to parse fixed window dates: {e}")
             sys.exit(1)
 
-    elif rrule_str:
-        if not duration_mins:
-            print("::error::Input 'duration_minutes' is required when using 'rrule'.")
-            sys.exit(1)
-        
+    elif inputs.rrule:
         try:
-            duration = int(duration_mins)
-            rule = rrule.rrulestr(rrule_str, dtstart=now_local.replace(tzinfo=None)) 
-            
+            duration = int(inputs.duration_minutes)
             now_naive = now_local.replace(tzinfo=None)
-            last_start = rule.before(now_naive, inc=True)
+            fast_rule = _fast_rrule_params(inputs.rrule)
+            if fast_rule:
+                last_start = _fast_rrule_match(fast_rule, duration, now_naive)
+            else:
+                rule = _compile_rrule(*_anchor_rrule(inputs.rrule, now_naive, duration))
+                last_start = rule.before(now_naive, inc=True)
             
             if last_start:
                 window_end = last_start + datetime.timedelta(minutes=duration)
@@ -120,8 +309,8 @@ def main():
                      is_frozen = True
                      window_type = "RRULE"
                      window_name = "Recurring Freeze Window"
-                     active_start = timezone.localize(last_start)
-                     active_end = timezone.localize(window_end)
+                     active_start = last_start.replace(tzinfo=timezone)
+                     active_end = window_end.replace(tzinfo=timezone)
                      reason = "Current time is within recurring freeze window"
             
         except Exception as e:
@@ -132,8 +321,8 @@ def main():
     override_reason_text = ""
     
     if is_frozen:
-        if secret_override and not overridden:
-            if secret_override.lower() == 'true':
+        if inputs.override and not overridden:
+            if inputs.override.lower() == 'true':
                 overridden = True
                 override_reason_text = "Secret override matched 'true'"
                 print(f"Override applied: {override_reason_text}")
@@ -142,13 +331,13 @@ def main():
     exit_code = 0
     
     if is_frozen and not overridden:
-        if behavior == "block":
+        if inputs.behavior == "block":
             final_decision = "BLOCK"
             exit_code = 1
-        elif behavior == "warn":
+        elif inputs.behavior == "warn":
             final_decision = "WARN"
             exit_code = 0
-            print(f"::warning::{fail_msg}")
+            print(f"::warning::{inputs.fail_message}")
         else:
             final_decision = "ALLOW"
             print(f"::notice::Freeze active but behavior is 'allow'.")
@@ -156,37 +345,48 @@ def main():
         final_decision = "ALLOW"
         reason = f"Frozen but overridden: {override_reason_text}"
 
-    set_output("is_frozen", "true" if is_frozen else "false")
-    set_output("decision", final_decision)
-    set_output("environment", env_name)
-    set_output("now_local", now_local.isoformat())
-    set_output("now_utc", now_utc.isoformat())
-    set_output("window_type", window_type)
-    set_output("window_name", window_name)
-    set_output("reason", reason)
-    set_output("freeze_start", active_start.isoformat() if active_start else "")
-    set_output("freeze_end", active_end.isoformat() if active_end else "")
-    set_output("overridden", "true" if overridden else "false")
-    set_output("override_reason", override_reason_text)
-
-    window_details_str = ""
-    if active_start and active_end:
-        window_details_str = f"- **Start:** {active_start}\n- **End:** {active_end}"
-        
-    write_summary(
-        env_name, 
-        now_local.strftime('%Y-%m-%d %H:%M:%S %Z'), 
-        now_utc.strftime('%Y-%m-%d %H:%M:%S UTC'), 
-        is_frozen, 
-        final_decision,
-        window_details_str,
-        override_reason_text
+    emit_outputs(
+        inputs.environment,
+        now_local,
+        now_utc,
+        is_frozen=is_frozen,
+        decision=final_decision,
+        window_type=window_type,
+        window_name=window_name,
+        reason=reason,
+        active_start=active_start,
+        active_end=active_end,
+        overridden=overridden,
+        override_reason=override_reason_text,
     )
 
+    if inputs.summary_enabled:
+        window_details_str = ""
+        if active_start and active_end:
+            window_details_str = f"- **Start:** {active_start}\n- **End:** {active_end}"
+
+        write_summary(
+            inputs.environment, 
+            now_local, 
+            now_utc, 
+            is_frozen, 
+            final_decision,
+            window_details_str,
+            override_reason_text
+        )
+
     if exit_code != 0:
-        print(f"::error::{fail_msg}")
-        
+        print(f"::error::{inputs.fail_message}")
+
     sys.exit(exit_code)
 
+def main():
+    # Buffered outputs reach GITHUB_OUTPUT in one write, even if run() exits
+    # early or the summary write fails.
+    try:
+        run()
+    finally:
+        flush_outputs()
+
 if __name__ == "__main__":
     main()
@@ -1,9 +1,11 @@
 import os
+import io
 import sys
+import contextlib
 import unittest
 from unittest.mock import patch, MagicMock
 import datetime
-import pytz
+import zoneinfo
 
 # Add the root directory to path to import entrypoint
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -16,31 +18,33 @@ class TestReleaseFreezeEnforcer(unittest.TestCase):
         self.env_patcher = patch.dict(os.environ, {}, clear=True)
         self.env_patcher.start()
         
-        # Mock GITHUB_OUTPUT and GITHUB_STEP_SUMMARY
+        # Mock GITHUB_OUTPUT and GITHUB_STEP_SUMMARY with in-memory buffers
         self.output_file = "github_output.txt"
         self.summary_file = "github_summary.txt"
         os.environ['GITHUB_OUTPUT'] = self.output_file
         os.environ['GITHUB_STEP_SUMMARY'] = self.summary_file
-        
-        # Ensure files exist and are empty
-        open(self.output_file, 'w').close()
-        open(self.summary_file, 'w').close()
+        self.output_buf = io.StringIO()
+        self.summary_buf = io.StringIO()
+        streams = {self.output_file: self.output_buf, self.summary_file: self.summary_buf}
+
+        def fake_open(path, *args, **kwargs):
+            if path in streams:
+                return contextlib.nullcontext(streams[path])
+            return open(path, *args, **kwargs)
+
+        self.open_patcher = patch('entrypoint.open', fake_open, create=True)
+        self.open_patcher.start()
     
     def tearDown(self):
+        self.open_patcher.stop()
         self.env_patcher.stop()
-        if os.path.exists(self.output_file):
-            os.remove(self.output_file)
-        if os.path.exists(self.summary_file):
-            os.remove(self.summary_file)
 
     def set_input(self, name, value):
         os.environ[f"INPUT_{name.upper()}"] = value
 
     def read_output(self):
-        with open(self.output_file, 'r') as f:
-            lines = f.readlines()
         outputs = {}
-        for line in lines:
+        for line in self.output_buf.getvalue().splitlines():
             if '=' in line:
                 key, value = line.strip().split('=', 1)
                 outputs[key] = value
@@ -51,11 +55,12 @@ class TestReleaseFreezeEnforcer(unittest.TestCase):
         mock_datetime.datetime.now.return_value = target_dt
         # IMPORTANT: We must use the real timedelta, otherwise date math fails
         mock_datetime.timedelta = datetime.timedelta
+        mock_datetime.datetime.fromisoformat = datetime.datetime.fromisoformat
         
     @patch('entrypoint.datetime')
     def test_no_freeze_configured(self, mock_datetime):
         # Mock time: 2023-01-01 12:00:00 UTC
-        target_now = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=pytz.utc)
+        target_now = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
         self.configure_mock_datetime(mock_datetime, target_now)
         
         self.set_input('environment', 'production')
@@ -72,7 +77,7 @@ class TestReleaseFreezeEnforcer(unittest.TestCase):
     @patch('entrypoint.datetime')
     def test_fixed_window_frozen_block(self, mock_datetime):
         # Mock time: 2023-12-25 10:00:00 UTC
-        target_now = datetime.datetime(2023, 12, 25, 10, 0, 0, tzinfo=pytz.utc)
+        target_now = datetime.datetime(2023, 12, 25, 10, 0, 0, tzinfo=datetime.timezone.utc)
         self.configure_mock_datetime(mock_datetime, target_now)
         
         self.set_input('environment', 'production')
@@ -92,7 +97,7 @@ class TestReleaseFreezeEnforcer(unittest.TestCase):
     @patch('entrypoint.datetime')
     def test_fixed_window_frozen_warn(self, mock_datetime):
         # Mock time: 2023-12-25 10:00:00 UTC
-        target_now = datetime.datetime(2023, 12, 25, 10, 0, 0, tzinfo=pytz.utc)
+        target_now = datetime.datetime(2023, 12, 25, 10, 0, 0, tzinfo=datetime.timezone.utc)
         self.configure_mock_datetime(mock_datetime, target_now)
         
         self.set_input('environment', 'production')
@@ -108,11 +113,57 @@ class TestReleaseFreezeEnforcer(unittest.TestCase):
         self.assertEqual(outputs['is_frozen'], 'true')
         self.assertEqual(outputs['decision'], 'WARN')
 
+        summary = self.summary_buf.getvalue()
+        self.assertIn("### Release Freeze Status: WARN", summary)
+        self.assertIn("| **Local Time** | `2023-12-25 10:00:00 UTC` |", summary)
+        self.assertIn("| **Status** | `Frozen` |", summary)
+        self.assertIn("#### Active Freeze Window\n- **Start:** 2023-12-24 00:00:00+00:00", summary)
+
+    @patch('entrypoint.datetime')
+    def test_fixed_window_local_timezone(self, mock_datetime):
+        # Mock time: 2023-12-25 10:00:00 in Asia/Dhaka (04:00 UTC)
+        target_now = datetime.datetime(2023, 12, 25, 10, 0, 0, tzinfo=zoneinfo.ZoneInfo('Asia/Dhaka'))
+        self.configure_mock_datetime(mock_datetime, target_now)
+
+        self.set_input('environment', 'production')
+        self.set_input('timezone', 'Asia/Dhaka')
+        self.set_input('freeze_start', '2023-12-25T09:00')
+        self.set_input('freeze_end', '2023-12-25T11:00')
+
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 1)
+        outputs = self.read_output()
+        self.assertEqual(outputs['is_frozen'], 'true')
+        self.assertEqual(outputs['now_local'], '2023-12-25T10:00:00+06:00')
+        self.assertEqual(outputs['now_utc'], '2023-12-25T04:00:00+00:00')
+
+    @patch('entrypoint.datetime')
+    def test_fixed_window_dst_offset(self, mock_datetime):
+        # Mock time: 2023-07-04 00:30 in America/New_York (EDT, UTC-4)
+        target_now = datetime.datetime(2023, 7, 4, 0, 30, 0, tzinfo=zoneinfo.ZoneInfo('America/New_York'))
+        self.configure_mock_datetime(mock_datetime, target_now)
+
+        self.set_input('environment', 'production')
+        self.set_input('timezone', 'America/New_York')
+        self.set_input('freeze_start', '2023-07-04T00:00')
+        self.set_input('freeze_end', '2023-07-05T00:00')
+
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 1)
+        outputs = self.read_output()
+        # replace(tzinfo=ZoneInfo) picks the summer offset, not LMT as pytz would
+        self.assertEqual(outputs['freeze_start'], '2023-07-04T00:00:00-04:00')
+        self.assertEqual(outputs['now_utc'], '2023-07-04T04:30:00+00:00')
+
     @patch('entrypoint.datetime')
     def test_recurring_window_weekend(self, mock_datetime):
         # RRULE: Every Saturday (SA)
         # Mock time: Saturday 2023-11-04 12:00:00 UTC
-        target_now = datetime.datetime(2023, 11, 4, 12, 0, 0, tzinfo=pytz.utc)
+        target_now = datetime.datetime(2023, 11, 4, 12, 0, 0, tzinfo=datetime.timezone.utc)
         self.configure_mock_datetime(mock_datetime, target_now)
         
         self.set_input('environment', 'production')
@@ -132,7 +183,7 @@ class TestReleaseFreezeEnforcer(unittest.TestCase):
     def test_recurring_window_not_frozen(self, mock_datetime):
         # RRULE: Every Saturday (SA)
         # Mock time: Friday 2023-11-03 12:00:00 UTC
-        target_now = datetime.datetime(2023, 11, 3, 12, 0, 0, tzinfo=pytz.utc)
+        target_now = datetime.datetime(2023, 11, 3, 12, 0, 0, tzinfo=datetime.timezone.utc)
         self.configure_mock_datetime(mock_datetime, target_now)
         
         self.set_input('environment', 'production')
@@ -147,10 +198,170 @@ class TestReleaseFreezeEnforcer(unittest.TestCase):
         outputs = self.read_output()
         self.assertEqual(outputs['is_frozen'], 'false')
 
+    @patch('entrypoint.datetime')
+    def test_recurring_window_spans_days(self, mock_datetime):
+        # RRULE: Every Friday at 17:00 for 64 hours
+        # Mock time: Saturday 2023-11-04 12:00:00 UTC
+        target_now = datetime.datetime(2023, 11, 4, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        self.configure_mock_datetime(mock_datetime, target_now)
+
+        self.set_input('environment', 'production')
+        self.set_input('rrule', 'FREQ=WEEKLY;BYDAY=FR;BYHOUR=17;BYMINUTE=0')
+        self.set_input('duration_minutes', '3840')
+
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 1)
+        outputs = self.read_output()
+        self.assertEqual(outputs['is_frozen'], 'true')
+        self.assertEqual(outputs['freeze_start'], '2023-11-03T17:00:00+00:00')
+
+    @patch('entrypoint.datetime')
+    def test_recurring_window_embedded_dtstart(self, mock_datetime):
+        # RRULE: Every other hour since 1970, for 30 minutes
+        # Mock time: 2023-11-04 12:10:00 UTC (even hour, inside window)
+        target_now = datetime.datetime(2023, 11, 4, 12, 10, 0, tzinfo=datetime.timezone.utc)
+        self.configure_mock_datetime(mock_datetime, target_now)
+
+        self.set_input('environment', 'production')
+        self.set_input('rrule', 'DTSTART:19700101T000000\nRRULE:FREQ=HOURLY;INTERVAL=2')
+        self.set_input('duration_minutes', '30')
+
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 1)
+        outputs = self.read_output()
+        self.assertEqual(outputs['freeze_start'], '2023-11-04T12:00:00+00:00')
+
+    @patch('entrypoint.datetime')
+    def test_invalid_inputs_exit_before_clock(self, mock_datetime):
+        self.set_input('environment', 'production')
+        self.set_input('rrule', 'FREQ=WEEKLY;BYDAY=SA')
+
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 1)
+        mock_datetime.datetime.now.assert_not_called()
+
+        self.set_input('duration_minutes', '60')
+        self.set_input('freeze_start', '2023-12-24T00:00')
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 1)
+        mock_datetime.datetime.now.assert_not_called()
+
+    @patch('entrypoint.datetime')
+    def test_outputs_flushed_when_summary_fails(self, mock_datetime):
+        target_now = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        self.configure_mock_datetime(mock_datetime, target_now)
+
+        self.set_input('environment', 'production')
+        os.environ['GITHUB_STEP_SUMMARY'] = os.path.join('missing-dir', 'summary.md')
+
+        with self.assertRaises(FileNotFoundError):
+            entrypoint.main()
+
+        self.assertEqual(self.read_output()['decision'], 'ALLOW')
+
+    @patch('entrypoint.datetime')
+    def test_fast_allow_skips_evaluation(self, mock_datetime):
+        # Mock time: Saturday 2023-11-04 12:00:00 UTC (inside the rrule window)
+        target_now = datetime.datetime(2023, 11, 4, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        self.configure_mock_datetime(mock_datetime, target_now)
+
+        self.set_input('environment', 'production')
+        self.set_input('behavior', 'allow')
+        self.set_input('summary', 'false')
+        self.set_input('fast_allow', 'true')
+        self.set_input('rrule', 'FREQ=WEEKLY;BYDAY=SA')
+        self.set_input('duration_minutes', '1440')
+
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 0)
+        outputs = self.read_output()
+        self.assertEqual(outputs['decision'], 'ALLOW')
+        self.assertEqual(outputs['is_frozen'], 'false')
+        self.assertEqual(outputs['window_type'], 'NONE')
+        self.assertEqual(outputs['freeze_start'], '')
+        self.assertEqual(outputs['now_local'], '2023-11-04T12:00:00+00:00')
+        self.assertEqual(outputs['now_utc'], '2023-11-04T12:00:00+00:00')
+
+        # An invalid timezone is still reported
+        self.set_input('timezone', 'Mars/Olympus_Mons')
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+        self.assertEqual(cm.exception.code, 1)
+
+    @patch('entrypoint.datetime')
+    def test_summary_disabled(self, mock_datetime):
+        target_now = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        self.configure_mock_datetime(mock_datetime, target_now)
+
+        self.set_input('environment', 'production')
+        self.set_input('summary', 'false')
+
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.main()
+
+        self.assertEqual(cm.exception.code, 0)
+        self.assertEqual(self.summary_buf.getvalue(), '')
+        self.assertEqual(self.read_output()['decision'], 'ALLOW')
+
+    def test_parse_iso_fallback(self):
+        self.assertEqual(entrypoint._parse_iso('2023-12-24T00:00'), datetime.datetime(2023, 12, 24))
+        self.assertEqual(entrypoint._parse_iso('Dec 24 2023 10:30'), datetime.datetime(2023, 12, 24, 10, 30))
+
+    def test_unknown_timezone(self):
+        with self.assertRaises(SystemExit) as cm:
+            entrypoint.parse_timezone('Mars/Olympus_Mons')
+        self.assertEqual(cm.exception.code, 1)
+
+    def test_timezone_case_insensitive(self):
+        self.assertEqual(entrypoint.parse_timezone('asia/dhaka'), zoneinfo.ZoneInfo('Asia/Dhaka'))
+        self.assertEqual(entrypoint.parse_timezone('est'), zoneinfo.ZoneInfo('EST'))
+
+    def test_fast_rrule_matches_dateutil(self):
+        rules = [
+            'FREQ=WEEKLY;BYDAY=SA',
+            'FREQ=WEEKLY;BYDAY=FR,SU;BYHOUR=17,9;BYMINUTE=30',
+            'FREQ=DAILY;BYHOUR=22',
+            'FREQ=DAILY;BYDAY=MO,WE;BYHOUR=0,12;BYMINUTE=15;BYSECOND=5',
+        ]
+        start = datetime.datetime(2023, 11, 1, 0, 0, 0)
+        for rule_str in rules:
+            fast_rule = entrypoint._fast_rrule_params(rule_str)
+            self.assertIsNotNone(fast_rule, rule_str)
+            for step in range(0, 14 * 24 * 60, 37):
+                now = start + datetime.timedelta(minutes=step)
+                for duration in (30, 1440, 3840):
+                    rule = entrypoint._compile_rrule(*entrypoint._anchor_rrule(rule_str, now, duration))
+                    expected = rule.before(now, inc=True)
+                    actual = entrypoint._fast_rrule_match(fast_rule, duration, now)
+                    window = datetime.timedelta(minutes=duration)
+                    self.assertEqual(
+                        bool(expected and now < expected + window),
+                        bool(actual and now < actual + window),
+                        (rule_str, now, duration),
+                    )
+                    if expected and now < expected + window:
+                        self.assertEqual(expected, actual)
+
+    def test_fast_rrule_falls_back(self):
+        for rule_str in ('FREQ=WEEKLY;INTERVAL=2;BYDAY=SA', 'FREQ=MONTHLY;BYMONTHDAY=1',
+                         'FREQ=DAILY;COUNT=3', 'FREQ=WEEKLY',
+                         'DTSTART:20230101T000000\nRRULE:FREQ=DAILY'):
+            self.assertIsNone(entrypoint._fast_rrule_params(rule_str), rule_str)
+
     @patch('entrypoint.datetime')
     def test_override_by_secret(self, mock_datetime):
         # Mock time: 2023-12-25 10:00:00 UTC (Frozen)
-        target_now = datetime.datetime(2023, 12, 25, 10, 0, 0, tzinfo=pytz.utc)
+        target_now = datetime.datetime(2023, 12, 25, 10, 0, 0, tzinfo=datetime.timezone.utc)
         self.configure_mock_datetime(mock_datetime, target_now)
         
         self.set_input('environment', 'production')